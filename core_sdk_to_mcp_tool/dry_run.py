@@ -0,0 +1,45 @@
+"""dry-run support: record dangerous calls instead of executing them."""
+import inspect
+from collections import deque
+
+
+# cap on remembered calls so a long-running server doesn't grow without bound
+MAX_RECORDED_CALLS = 10_000
+
+
+class DryRunInterceptor:
+    """intercepts dangerous tool calls when dry run is enabled."""
+    
+    def __init__(self, enabled=False, max_records=MAX_RECORDED_CALLS):
+        self.enabled = enabled
+        self.intercepted_calls = deque(maxlen=max_records)
+        # signature strings by id(callable); tools stay referenced by the
+        # registry for the server's lifetime so ids are not reused
+        self._sig_cache = {}
+    
+    def should_intercept(self, tool_name, is_dangerous):
+        """check if this call should be recorded instead of executed."""
+        return self.enabled and is_dangerous
+    
+    def intercept(self, tool_name, callable_obj, arguments):
+        """record the call and describe what would have run."""
+        key = id(callable_obj)
+        sig = self._sig_cache.get(key)
+        if sig is None:
+            try:
+                sig = str(inspect.signature(callable_obj))
+            except (ValueError, TypeError):
+                sig = "(...)"
+            self._sig_cache[key] = sig
+        
+        self.intercepted_calls.append({
+            "tool": tool_name,
+            "signature": sig,
+            "arguments": arguments
+        })
+        
+        return {
+            "dry_run": True,
+            "message": f"would call {tool_name}{sig}",
+            "arguments": arguments
+        }
@@ -1,6 +1,8 @@
 """discover methods from python modules."""
 import inspect
 import importlib
+import threading
+import types
 from safety import is_dangerous
 
 
@@ -51,6 +53,12 @@ SDK_CONFIGS = {
 }
 
 
+# isinstance tuples for member filtering (one C call instead of a python
+# predicate per attribute)
+_FUNCTION_TYPES = (types.FunctionType, types.BuiltinFunctionType)
+_CLASS_MEMBER_TYPES = (types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
 def discover_methods(module, module_name, allow_dangerous=False):
     """find all callable methods in a module."""
     methods = []
@@ -58,6 +66,11 @@ def discover_methods(module, module_name, allow_dangerous=False):
     # check if this is a complex SDK
     sdk_config = SDK_CONFIGS.get(module_name, {})
     max_tools = sdk_config.get("max_tools", None)
+    discover_functions = sdk_config.get("discover_functions", True)
+    discover_operation_groups = sdk_config.get("discover_operation_groups", False)
+    # class whitelists as sets, checked once per class in every module
+    target_classes = frozenset(sdk_config.get("client_classes") or ())
+    resource_classes = frozenset(sdk_config.get("resource_classes") or ())
     
     # try to load better submodules for complex SDKs
     modules_to_scan = [module]
@@ -65,35 +78,32 @@ def discover_methods(module, module_name, allow_dangerous=False):
         try:
             submodule = importlib.import_module(submodule_name)
             modules_to_scan.append(submodule)
-        except:
+        except Exception:
             pass
     
     for mod in modules_to_scan:
+        # one sorted member listing per module, filtered inline below
+        members = inspect.getmembers(mod)
+        
         # find module-level functions (both regular and builtin)
-        if sdk_config.get("discover_functions", True):
-            for name, obj in inspect.getmembers(mod, lambda x: inspect.isfunction(x) or inspect.isbuiltin(x)):
-                if not name.startswith("_"):
-                    sig = _get_signature(obj)
-                    if sig:
-                        method_info = _create_method_info(
-                            f"{module_name}.{name}", 
-                            obj, 
-                            sig,
-                            allow_dangerous
-                        )
-                        if method_info:
-                            methods.append(method_info)
-                            # check max tools limit
-                            if max_tools and len(methods) >= max_tools:
-                                return methods
+        if discover_functions:
+            for name, obj in members:
+                if isinstance(obj, _FUNCTION_TYPES) and not name.startswith("_"):
+                    method_info = _create_method_info(
+                        f"{module_name}.{name}",
+                        obj,
+                        allow_dangerous
+                    )
+                    if method_info:
+                        methods.append(method_info)
+                        # check max tools limit
+                        if max_tools and len(methods) >= max_tools:
+                            return methods
         
         # find class methods - but handle complex SDKs specially
-        target_classes = sdk_config.get("client_classes", None)
-        resource_classes = sdk_config.get("resource_classes", None)
-        
-        for class_name, cls in inspect.getmembers(mod, inspect.isclass):
-            # skip private classes
-            if class_name.startswith("_"):
+        for class_name, cls in members:
+            # skip non-classes and private classes
+            if not isinstance(cls, type) or class_name.startswith("_"):
                 continue
             
             # if we have a whitelist, only process those classes
@@ -105,12 +115,12 @@ def discover_methods(module, module_name, allow_dangerous=False):
                 continue
             
             # Handle client classes (need instantiation for instance methods)
-            if target_classes and class_name in target_classes:
+            if target_classes:
                 try:
                     instance = _try_instantiate_client(cls, class_name, module_name)
                     if instance:
                         # Check if we should discover operation groups (Azure pattern)
-                        if sdk_config.get("discover_operation_groups", False):
+                        if discover_operation_groups:
                             # Discover Azure operation groups (resource_groups, virtual_machines, etc.)
                             new_methods = _discover_azure_operation_groups(instance, f"{module_name}.{class_name}", allow_dangerous, max_tools - len(methods) if max_tools else None)
                             methods.extend(new_methods)
@@ -122,53 +132,91 @@ def discover_methods(module, module_name, allow_dangerous=False):
                         if max_tools and len(methods) >= max_tools:
                             return methods
                         continue
-                except:
+                except Exception:
                     pass
             
             # Handle resource classes (Stripe - use class methods, not instance)
-            if resource_classes and class_name in resource_classes:
+            if resource_classes:
                 # For Stripe resources, discover class methods (list, create, retrieve, etc.)
-                for method_name in dir(cls):
-                    if method_name.startswith("_"):
+                # methods inherited from shared bases (APIResource...) still
+                # become one tool per class, but their signatures and docs
+                # are cached per underlying function
+                for method_name, raw in _static_members(cls):
+                    if not _is_method_like(raw):
                         continue
                     try:
                         method = getattr(cls, method_name)
                         if callable(method) and (inspect.ismethod(method) or inspect.isfunction(method)):
-                            sig = _get_signature(method)
-                            if sig:
-                                method_info = _create_method_info(
-                                    f"{module_name}.{class_name}.{method_name}",
-                                    method,
-                                    sig,
-                                    allow_dangerous
-                                )
-                                if method_info:
-                                    methods.append(method_info)
-                                    if max_tools and len(methods) >= max_tools:
-                                        return methods
-                    except:
+                            method_info = _create_method_info(
+                                f"{module_name}.{class_name}.{method_name}",
+                                method,
+                                allow_dangerous
+                            )
+                            if method_info:
+                                methods.append(method_info)
+                                if max_tools and len(methods) >= max_tools:
+                                    return methods
+                    except Exception:
                         pass
                 continue
             
-            # fallback: discover class methods normally
-            for method_name, method in inspect.getmembers(cls, lambda x: inspect.isfunction(x) or inspect.isbuiltin(x) or inspect.ismethod(x)):
-                if not method_name.startswith("_"):
-                    sig = _get_signature(method)
-                    if sig:
-                        method_info = _create_method_info(
-                            f"{module_name}.{class_name}.{method_name}",
-                            method,
-                            sig,
-                            allow_dangerous
-                        )
-                        if method_info:
-                            methods.append(method_info)
-                            if max_tools and len(methods) >= max_tools:
-                                return methods
+            # fallback: discover class methods normally. only method-like
+            # members are bound; the type check then keeps functions,
+            # builtins and classmethods, not nested classes or descriptors
+            for method_name, raw in _static_members(cls):
+                if not _is_method_like(raw):
+                    continue
+                try:
+                    method = getattr(cls, method_name)
+                except Exception:
+                    continue
+                if isinstance(method, _CLASS_MEMBER_TYPES):
+                    method_info = _create_method_info(
+                        f"{module_name}.{class_name}.{method_name}",
+                        method,
+                        allow_dangerous
+                    )
+                    if method_info:
+                        methods.append(method_info)
+                        if max_tools and len(methods) >= max_tools:
+                            return methods
     
     return methods
 
 
+# process-wide client setup, done once no matter how many client classes or
+# sdks (loaded in parallel) need it
+_credential_lock = threading.Lock()
+_azure_credential = None
+_kube_config_loaded = False
+
+
+def _get_azure_credential():
+    """shared DefaultAzureCredential (creating one probes env, cli and imds)."""
+    global _azure_credential
+    with _credential_lock:
+        if _azure_credential is None:
+            from azure.identity import DefaultAzureCredential
+            _azure_credential = DefaultAzureCredential()
+        return _azure_credential
+
+
+def _load_kube_config_once():
+    """load kubeconfig the first time a kubernetes client is created."""
+    global _kube_config_loaded
+    with _credential_lock:
+        if _kube_config_loaded:
+            return
+        _kube_config_loaded = True
+        try:
+            from kubernetes import config
+            # Try to load kubeconfig (will use default ~/.kube/config)
+            config.load_kube_config()
+        except Exception:
+            # If no kubeconfig, skip (might be in-cluster)
+            pass
+
+
 def _try_instantiate_client(cls, class_name, module_name):
     """try to instantiate a client class with actual credentials."""
     import os
@@ -182,13 +230,12 @@ def _try_instantiate_client(cls, class_name, module_name):
             # Fallback: try without token (some methods work)
             try:
                 return cls()
-            except:
+            except Exception:
                 return None
         
         # Azure - use credentials from environment
-        if "azure" in module_name and "ManagementClient" in class_name:
+        if module_name.startswith("azure") and class_name.endswith("ManagementClient"):
             try:
-                from azure.identity import DefaultAzureCredential
                 subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID")
                 tenant_id = os.getenv("AZURE_TENANT_ID")
                 
@@ -197,21 +244,14 @@ def _try_instantiate_client(cls, class_name, module_name):
                     if tenant_id:
                         os.environ["AZURE_TENANT_ID"] = tenant_id
                     
-                    credential = DefaultAzureCredential()
-                    return cls(credential, subscription_id)
+                    return cls(_get_azure_credential(), subscription_id)
             except Exception as e:
                 # If Azure auth fails, skip instantiation
                 return None
         
         # Kubernetes - load kubeconfig if available
         if module_name == "kubernetes":
-            try:
-                from kubernetes import config
-                # Try to load kubeconfig (will use default ~/.kube/config)
-                config.load_kube_config()
-            except:
-                # If no kubeconfig, skip (might be in-cluster)
-                pass
+            _load_kube_config_once()
             
             # Instantiate the client
             return cls()
@@ -222,30 +262,42 @@ def _try_instantiate_client(cls, class_name, module_name):
         return None
 
 
+def _static_members(obj):
+    """public (name, raw attribute) pairs, read without running descriptors."""
+    try:
+        members = inspect.getmembers_static(obj)
+    except Exception:
+        return []
+    return [(name, value) for name, value in members if not name.startswith("_")]
+
+
+def _is_method_like(raw):
+    """check if a raw class/instance attribute is something that binds to a method."""
+    return callable(raw) or isinstance(raw, (classmethod, staticmethod))
+
+
 def _discover_instance_methods(instance, prefix, allow_dangerous, max_methods=None):
     """discover methods from an instance."""
     methods = []
     
-    for method_name in dir(instance):
-        if method_name.startswith("_"):
+    for method_name, raw in _static_members(instance):
+        # only bind attributes that are methods; properties are not fired
+        if not _is_method_like(raw):
             continue
         
         try:
             method = getattr(instance, method_name)
             if callable(method):
-                sig = _get_signature(method)
-                if sig:
-                    method_info = _create_method_info(
-                        f"{prefix}.{method_name}",
-                        method,
-                        sig,
-                        allow_dangerous
-                    )
-                    if method_info:
-                        methods.append(method_info)
-                        if max_methods and len(methods) >= max_methods:
-                            return methods
-        except:
+                method_info = _create_method_info(
+                    f"{prefix}.{method_name}",
+                    method,
+                    allow_dangerous
+                )
+                if method_info:
+                    methods.append(method_info)
+                    if max_methods and len(methods) >= max_methods:
+                        return methods
+        except Exception:
             continue
     
     return methods
@@ -269,34 +321,32 @@ def _discover_azure_operation_groups(client_instance, prefix, allow_dangerous, m
             # Check if this looks like an operation group (has list, get, create, etc.)
             if hasattr(operation_group, 'list') or hasattr(operation_group, 'get') or hasattr(operation_group, 'create_or_update') or hasattr(operation_group, 'list_all'):
                 # This is an operation group! Discover its methods
-                for method_name in dir(operation_group):
-                    if method_name.startswith("_"):
+                for method_name, raw in _static_members(operation_group):
+                    if not _is_method_like(raw):
                         continue
                     
                     try:
                         method = getattr(operation_group, method_name)
                         if callable(method):
-                            sig = _get_signature(method)
-                            if sig:
-                                # Name format: azure.mgmt.resource.ResourceManagementClient.resource_groups.list
-                                method_info = _create_method_info(
-                                    f"{prefix}.{attr_name}.{method_name}",
-                                    method,
-                                    sig,
-                                    allow_dangerous
-                                )
-                                if method_info:
-                                    methods.append(method_info)
-                                    if max_methods and len(methods) >= max_methods:
-                                        return methods
-                    except:
+                            # Name format: azure.mgmt.resource.ResourceManagementClient.resource_groups.list
+                            method_info = _create_method_info(
+                                f"{prefix}.{attr_name}.{method_name}",
+                                method,
+                                allow_dangerous
+                            )
+                            if method_info:
+                                methods.append(method_info)
+                                if max_methods and len(methods) >= max_methods:
+                                    return methods
+                    except Exception:
                         continue
-        except:
+        except Exception:
             continue
     
     # Second pass: discover remaining operation groups
-    for attr_name in dir(client_instance):
-        if attr_name.startswith("_") or attr_name in priority_groups:
+    for attr_name, raw in _static_members(client_instance):
+        # operation groups are attributes or properties, never methods
+        if attr_name in priority_groups or _is_method_like(raw):
             continue
         
         try:
@@ -305,54 +355,85 @@ def _discover_azure_operation_groups(client_instance, prefix, allow_dangerous, m
             # Check if this looks like an operation group (has list, get, create, etc.)
             if hasattr(operation_group, 'list') or hasattr(operation_group, 'get') or hasattr(operation_group, 'create_or_update') or hasattr(operation_group, 'list_all'):
                 # This is an operation group! Discover its methods
-                for method_name in dir(operation_group):
-                    if method_name.startswith("_"):
+                for method_name, raw in _static_members(operation_group):
+                    if not _is_method_like(raw):
                         continue
                     
                     try:
                         method = getattr(operation_group, method_name)
                         if callable(method):
-                            sig = _get_signature(method)
-                            if sig:
-                                # Name format: azure.mgmt.resource.ResourceManagementClient.resource_groups.list
-                                method_info = _create_method_info(
-                                    f"{prefix}.{attr_name}.{method_name}",
-                                    method,
-                                    sig,
-                                    allow_dangerous
-                                )
-                                if method_info:
-                                    methods.append(method_info)
-                                    if max_methods and len(methods) >= max_methods:
-                                        return methods
-                    except:
+                            # Name format: azure.mgmt.resource.ResourceManagementClient.resource_groups.list
+                            method_info = _create_method_info(
+                                f"{prefix}.{attr_name}.{method_name}",
+                                method,
+                                allow_dangerous
+                            )
+                            if method_info:
+                                methods.append(method_info)
+                                if max_methods and len(methods) >= max_methods:
+                                    return methods
+                    except Exception:
                         continue
-        except:
+        except Exception:
             continue
     
     return methods
 
 
+# introspection results keyed by (id of underlying function, bound?).
+# bound methods sharing a __func__ (inherited methods, classmethods on
+# sibling classes, operation groups of one type) have the same signature and
+# docstring, so they are only inspected once. entries keep the function
+# referenced so its id can't be reused while cached
+_signature_cache = {}
+_doc_cache = {}
+
+
+def _cache_key(obj):
+    """key introspection caches on the function behind a bound method."""
+    func = getattr(obj, "__func__", obj)
+    return func, (id(func), func is not obj)
+
+
 def _get_signature(obj):
     """safely get signature."""
-    try:
-        return inspect.signature(obj)
-    except:
-        return None
+    func, key = _cache_key(obj)
+    entry = _signature_cache.get(key)
+    if entry is None:
+        try:
+            sig = inspect.signature(obj)
+        except (ValueError, TypeError):
+            sig = None
+        entry = _signature_cache[key] = (func, sig)
+    return entry[1]
+
 
+def _get_doc(obj):
+    """get cleaned docstring ("" when there is none)."""
+    func, key = _cache_key(obj)
+    entry = _doc_cache.get(key)
+    if entry is None:
+        entry = _doc_cache[key] = (func, inspect.getdoc(obj) or "")
+    return entry[1]
 
-def _create_method_info(name, obj, sig, allow_dangerous):
-    """create method metadata."""
+
+def _create_method_info(name, obj, allow_dangerous):
+    """create method metadata, or None if the method is filtered out."""
     dangerous = is_dangerous(name)
     
-    # filter out dangerous methods unless explicitly allowed
+    # filter out dangerous methods unless explicitly allowed, before paying
+    # for inspect.signature
     if dangerous and not allow_dangerous:
         return None
     
+    sig = _get_signature(obj)
+    if not sig:
+        return None
+    
     return {
         "name": name,
         "callable": obj,
         "signature": sig,
-        "docstring": inspect.getdoc(obj),
+        "docstring": _get_doc(obj),
         "is_dangerous": dangerous
     }
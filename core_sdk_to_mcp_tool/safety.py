@@ -1,4 +1,6 @@
 """basic safety checks for method calls."""
+import re
+from functools import lru_cache
 
 
 # methods that look dangerous
@@ -7,11 +9,27 @@ DANGEROUS_PATTERNS = [
     "create", "update", "patch", "write"
 ]
 
+# key fragments that mark a value as secret
+SECRET_PATTERNS = ["password", "token", "key", "secret"]
 
+# one alternation per list, so each check is a single regex scan
+_DANGEROUS_RE = re.compile("|".join(map(re.escape, DANGEROUS_PATTERNS)))
+_SECRET_RE = re.compile("|".join(map(re.escape, SECRET_PATTERNS)))
+
+# types redact_secrets descends into
+_CONTAINERS = (dict, list)
+
+
+@lru_cache(maxsize=4096)
 def is_dangerous(method_name):
     """check if method name looks dangerous."""
-    name_lower = method_name.lower()
-    return any(pattern in name_lower for pattern in DANGEROUS_PATTERNS)
+    return _DANGEROUS_RE.search(method_name.lower()) is not None
+
+
+@lru_cache(maxsize=4096)
+def _is_secret_key(key):
+    """check if a response key names a secret (keys repeat across records)."""
+    return _SECRET_RE.search(key.lower()) is not None
 
 
 def should_allow(method_name, allow_dangerous=False):
@@ -23,17 +41,62 @@ def should_allow(method_name, allow_dangerous=False):
 
 def redact_secrets(data):
     """try to remove secrets from data."""
-    # basic redaction - needs work
-    if isinstance(data, dict):
-        redacted = {}
-        for key, value in data.items():
-            key_lower = key.lower()
-            if any(word in key_lower for word in ["password", "token", "key", "secret"]):
-                redacted[key] = "***"
-            else:
-                redacted[key] = redact_secrets(value)
-        return redacted
-    elif isinstance(data, list):
-        return [redact_secrets(item) for item in data]
-    return data
+    # iterative post-order walk, so deep responses can't hit the recursion
+    # limit. containers with no secrets underneath are returned as-is
+    # rather than copied; input is never modified
+    if not isinstance(data, _CONTAINERS):
+        return data
+    
+    done = {}  # id(container) -> redacted container (itself if unchanged)
+    expanded = set()
+    stack = [data]
+    while stack:
+        node = stack[-1]
+        if id(node) in done:
+            stack.pop()
+            continue
+        
+        if id(node) not in expanded:
+            expanded.add(id(node))
+            children = [
+                child for child in _child_values(node)
+                if isinstance(child, _CONTAINERS) and id(child) not in done
+            ]
+            if children:
+                stack.extend(children)
+                continue
+        
+        # children are finished (or reference back up the stack)
+        stack.pop()
+        done[id(node)] = _redact_node(node, done)
+    
+    return done[id(data)]
+
+
+def _child_values(node):
+    """values redact_secrets has to look inside."""
+    if isinstance(node, dict):
+        return [value for key, value in node.items() if not _is_secret_key(key)]
+    return node
+
 
+def _redact_node(node, done):
+    """redacted version of one container, copied only if something changed."""
+    if isinstance(node, dict):
+        redacted = None
+        for key, value in node.items():
+            new = "***" if _is_secret_key(key) else done.get(id(value), value)
+            if new is not value:
+                if redacted is None:
+                    redacted = dict(node)
+                redacted[key] = new
+        return node if redacted is None else redacted
+    
+    redacted = None
+    for i, value in enumerate(node):
+        new = done.get(id(value), value)
+        if new is not value:
+            if redacted is None:
+                redacted = list(node)
+            redacted[i] = new
+    return node if redacted is None else redacted
@@ -51,6 +51,33 @@ def test_schema_generation():
     assert "name" in schema["required"]
     assert "age" not in schema["required"]
     
+    # memoized schemas keep equal defaults of different types apart
+    def first(values=(0,)):
+        return values
+    
+    def second(values=(False,)):
+        return values
+    
+    default = signature_to_schema(inspect.signature(first))["properties"]["values"]["default"]
+    assert default == (0,) and type(default[0]) is int
+    default = signature_to_schema(inspect.signature(second))["properties"]["values"]["default"]
+    assert default[0] is False
+    
+    # defaults are checked by identity, so a non-bool != is never evaluated
+    class Array:
+        def __ne__(self, other):
+            raise ValueError("truth value is ambiguous")
+        
+        def __str__(self):
+            return "array"
+    
+    def masked(data, mask=Array()):
+        return data
+    
+    schema = signature_to_schema(inspect.signature(masked))
+    assert schema["properties"]["mask"]["default"] == "array"
+    assert schema["required"] == ["data"]
+    
     print("[OK] test 2 passed: schema generation works correctly")
     return True
 
@@ -108,6 +135,49 @@ def test_mcp_protocol_tools_call():
     assert "error" in error_response
     assert error_response["error"]["code"] == -32601
     
+    # the server's pre-encoded frame matches the dict response
+    from mcp_protocol import encode_tool_result
+    encoded = json.loads(encode_tool_result({"msg": 'say "hi"', 1: [True]}, "req-1"))
+    assert encoded["id"] == "req-1"
+    assert encoded["result"]["content"] == [{"type": "text", "text": '{"msg":"say \\"hi\\"","1":[true]}'}]
+    
+    # containers become json text, anything else keeps its str()
+    assert json.loads(encode_tool_result("plain", 2))["result"]["content"][0]["text"] == "plain"
+    assert json.loads(encode_tool_result(None, 3))["result"]["content"][0]["text"] == "None"
+    
+    # the text is the same with or without orjson installed
+    import datetime
+    import enum
+    import mcp_protocol
+    
+    class Color(enum.Enum):
+        RED = "red"
+    
+    payload = {
+        "at": datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        "on": datetime.date(2026, 1, 2),
+        "color": Color.RED,
+        "scores": [1.5, float("nan"), float("inf")],
+        2: "é"
+    }
+    expected = '{"at":"2026-01-02T03:04:05+00:00","on":"2026-01-02","color":"red","scores":[1.5,null,null],"2":"é"}'
+    assert mcp_protocol._result_text(payload) == expected
+    real_orjson = mcp_protocol.orjson
+    mcp_protocol.orjson = None
+    try:
+        assert mcp_protocol._result_text(payload) == expected
+        circular = []
+        circular.append(circular)
+        assert mcp_protocol._result_text(circular) == "[[...]]"
+    finally:
+        mcp_protocol.orjson = real_orjson
+    
+    from mcp_protocol import encode_error
+    error = json.loads(encode_error(-32601, "method not found: x", 4))
+    assert error == {"jsonrpc": "2.0", "error": {"code": -32601, "message": "method not found: x"}, "id": 4}
+    error = json.loads(encode_error(-32603, "boom", 5, {"type": "TypeError"}))
+    assert error["error"]["data"] == {"type": "TypeError"} and error["id"] == 5
+    
     print("[OK] test 4 passed: mcp tools/call protocol works")
     return True
 
@@ -211,6 +281,581 @@ def test_executor_with_retry():
     return True
 
 
+def test_dry_run_interceptor():
+    """test 10: test dry-run interception of dangerous calls."""
+    from dry_run import DryRunInterceptor
+    
+    interceptor = DryRunInterceptor(enabled=True, max_records=2)
+    
+    def delete_item(item_id: int):
+        raise AssertionError("should not run in dry-run mode")
+    
+    assert interceptor.should_intercept("api.delete_item", True)
+    assert not interceptor.should_intercept("api.get_item", False)
+    assert not DryRunInterceptor(enabled=False).should_intercept("api.delete_item", True)
+    
+    for i in range(3):
+        result = interceptor.intercept("api.delete_item", delete_item, {"item_id": i})
+    
+    assert result["dry_run"] is True
+    assert "(item_id: int)" in result["message"]
+    assert len(interceptor.intercepted_calls) == 2, "history should be bounded"
+    assert interceptor.intercepted_calls[-1]["arguments"] == {"item_id": 2}
+    
+    print("[OK] test 10 passed: dry-run interception works")
+    return True
+
+
+def test_executor_async_tools():
+    """test 11: test executor runs coroutine tools on a reused loop."""
+    import asyncio
+    
+    config = Config()
+    config.max_retries = 1
+    
+    executor = Executor(config)
+    
+    async def async_multiply(a: int, b: int):
+        await asyncio.sleep(0)
+        return a * b, asyncio.get_running_loop()
+    
+    try:
+        result1, loop1 = executor.execute(async_multiply, {"a": 3, "b": 4})
+        result2, loop2 = executor.execute(async_multiply, {"a": 5, "b": 6})
+    finally:
+        executor.close()
+    
+    assert (result1, result2) == (12, 30)
+    assert loop1 is loop2, "async tools should share one event loop"
+    assert loop1.is_closed()
+    
+    print("[OK] test 11 passed: executor async tools work")
+    return True
+
+
+def test_executor_execute_many():
+    """test 12: test executor runs a batch of tools concurrently."""
+    import asyncio
+    import time
+    
+    config = Config()
+    config.max_retries = 1
+    
+    executor = Executor(config)
+    
+    async def slow_echo(value):
+        await asyncio.sleep(0.2)
+        return value
+    
+    def failing():
+        raise ValueError("bad input")
+    
+    items = [
+        ("test.echo", slow_echo, {"value": 1}),
+        ("test.echo", slow_echo, {"value": 2}),
+        ("test.fail", failing, {}),
+    ]
+    
+    start = time.monotonic()
+    try:
+        results = executor.execute_many(items)
+    finally:
+        executor.close()
+    elapsed = time.monotonic() - start
+    
+    assert results[:2] == [1, 2]
+    assert isinstance(results[2], ValueError)
+    assert elapsed < 0.4, "async calls should overlap"
+    
+    print("[OK] test 12 passed: executor batch execution works")
+    return True
+
+
+def test_tool_filter():
+    """test 13: test allowlist/denylist tool filtering."""
+    from filters import ToolFilter
+    
+    tools = [{"name": n} for n in ["os.getcwd", "os.listdir", "os.remove", "json.dumps"]]
+    
+    assert len(ToolFilter().filter_tools(tools)) == 4, "no patterns keeps everything"
+    
+    allow_os = ToolFilter(allowlist=["os.*"])
+    assert [t["name"] for t in allow_os.filter_tools(tools)] == ["os.getcwd", "os.listdir", "os.remove"]
+    
+    deny = ToolFilter(allowlist=["os.*", "json.dumps"], denylist=["*.remove", "os.list?ir"])
+    assert [t["name"] for t in deny.filter_tools(tools)] == ["os.getcwd", "json.dumps"]
+    
+    exact = ToolFilter(allowlist=["os.getcwd"])
+    assert exact.should_include("os.getcwd")
+    assert not exact.should_include("os.getcwdb")
+    assert not exact.should_include("osXgetcwd"), "exact names are literal, not regex"
+    
+    mixed = ToolFilter(allowlist=["json.*", "os.getcwd"], denylist=["json.dumps"])
+    assert [t["name"] for t in mixed.filter_tools(tools)] == ["os.getcwd"]
+    
+    print("[OK] test 13 passed: tool filtering works")
+    return True
+
+
+def test_rate_limiter():
+    """test 14: test per-key rate limiting."""
+    from rate_limit import RateLimiter
+    
+    limiter = RateLimiter(max_calls=3, time_window=60)
+    
+    assert [limiter.check_limit("os") for _ in range(4)] == [True, True, True, False]
+    assert limiter.get_remaining("os") == 0
+    assert limiter.check_limit("json"), "keys are limited independently"
+    assert limiter.get_remaining("json") == 2
+    assert limiter.get_remaining("unused") == 3
+    assert limiter.stats()["total_blocked"] == 1
+    
+    import time
+    assert limiter.maybe_evict() == 0, "active buckets are kept"
+    assert limiter.maybe_evict(time.monotonic() + 60) == 2, "idle buckets are dropped"
+    assert limiter.stats()["keys"] == 0
+    
+    # concurrent checks never hand out the same token twice; a tiny switch
+    # interval makes the threads interleave inside check_limit
+    import threading
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    limiter = RateLimiter(max_calls=500, time_window=3600)
+    allowed = []
+    
+    def take():
+        for _ in range(1000):
+            if limiter.check_limit("shared"):
+                allowed.append(1)
+    
+    threads = [threading.Thread(target=take) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(allowed) == 500, f"expected 500 tokens, got {len(allowed)}"
+    
+    # eviction is safe while other threads add buckets
+    limiter = RateLimiter(max_calls=5, time_window=60)
+    errors = []
+    done = threading.Event()
+    
+    def add_keys(worker_id):
+        for i in range(3000):
+            limiter.check_limit(f"k{worker_id}-{i}")
+    
+    def evict():
+        try:
+            while not done.is_set():
+                limiter.maybe_evict()
+        except Exception as e:
+            errors.append(e)
+    
+    try:
+        evictor = threading.Thread(target=evict)
+        evictor.start()
+        threads = [threading.Thread(target=add_keys, args=(n,)) for n in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        evictor.join()
+    finally:
+        sys.setswitchinterval(old_interval)
+    assert not errors, f"concurrent eviction raised: {errors!r}"
+    assert limiter.stats()["keys"] == 9000
+    
+    print("[OK] test 14 passed: rate limiting works")
+    return True
+
+
+def test_executor_cache():
+    """test 15: test executor result caching."""
+    config = Config()
+    config.max_retries = 1
+    config.enable_cache = True
+    config.cache_ttl = 60
+    
+    executor = Executor(config)
+    
+    call_count = [0]
+    
+    def lookup(name, tags=None):
+        call_count[0] += 1
+        return None if name == "missing" else name.upper()
+    
+    assert executor.execute(lookup, {"name": "a"}, "test.lookup") == "A"
+    assert executor.execute(lookup, {"name": "a"}, "test.lookup") == "A"
+    assert call_count[0] == 1, "second call should hit the cache"
+    
+    executor.execute(lookup, {"name": "a", "tags": ["x"]}, "test.lookup")
+    executor.execute(lookup, {"name": "a", "tags": ["x"]}, "test.lookup")
+    assert call_count[0] == 2, "unhashable arguments should still be cached"
+    
+    assert executor.execute(lookup, {"name": "missing"}, "test.lookup") is None
+    assert executor.execute(lookup, {"name": "missing"}, "test.lookup") is None
+    assert call_count[0] == 3, "None results should be cached too"
+    
+    executor.execute(lookup, {"name": "a"})
+    assert call_count[0] == 4, "calls without a tool name bypass the cache"
+    assert executor.cache.stats()["hits"] == 3
+    
+    # equal but differently typed arguments are cached separately
+    def show(value):
+        return repr(value)
+    
+    assert [executor.execute(show, {"value": v}, "test.show") for v in (1, True, 1.0)] == ["1", "True", "1.0"]
+    assert [executor.execute(show, {"value": v}, "test.show") for v in ([1], [True])] == ["[1]", "[True]"]
+    
+    # the same holds inside lists and dicts, even when str() matches
+    from decimal import Decimal
+    values = ([Decimal("1")], ["1"], [(1,)], [[1]], {"a": [1.0]}, {"a": [1]})
+    assert [executor.execute(show, {"value": v}, "test.show") for v in values] == [repr(v) for v in values]
+    
+    # values with no hashable form are not cached
+    class Unhashable:
+        __hash__ = None
+    
+    calls_before = call_count[0]
+    executor.execute(lookup, {"name": "b", "tags": [Unhashable()]}, "test.lookup")
+    executor.execute(lookup, {"name": "b", "tags": [Unhashable()]}, "test.lookup")
+    assert call_count[0] == calls_before + 2
+    assert executor.cache.stats()["hits"] == 3
+    
+    # bounded: the least recently used entry is evicted first
+    from executor import SimpleCache, _MISSING
+    cache = SimpleCache(default_ttl=60, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is _MISSING, "b was least recently used"
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    cache.set("d", 4, ttl=-1)
+    assert cache.get("d") is _MISSING, "expired entries are not returned"
+    
+    print("[OK] test 15 passed: executor caching works")
+    return True
+
+
+def test_instance_discovery_skips_properties():
+    """test 16: test instance discovery doesn't evaluate properties."""
+    from reflection import _discover_instance_methods
+    
+    fired = []
+    
+    class Client:
+        def get_user(self, user_id: int):
+            return user_id
+        
+        @classmethod
+        def from_env(cls):
+            return cls()
+        
+        @property
+        def rate_limit(self):
+            fired.append("rate_limit")
+            return lambda: None
+    
+    methods = _discover_instance_methods(Client(), "sdk.Client", allow_dangerous=False)
+    names = [m["name"] for m in methods]
+    
+    assert names == ["sdk.Client.from_env", "sdk.Client.get_user"]
+    assert fired == [], "properties should not be evaluated during discovery"
+    
+    print("[OK] test 16 passed: instance discovery skips properties")
+    return True
+
+
+def test_server_loads_sdks_in_order():
+    """test 17: test server loads sdks concurrently but keeps config order."""
+    from server import MCPServer
+    
+    config = Config()
+    config.sdks = ["json", "no_such_sdk_module", "base64"]
+    server = MCPServer(config)
+    
+    names = [tool["name"] for tool in server.tools]
+    assert names, "should load tools from the importable sdks"
+    assert {name.split(".")[0] for name in names} == {"json", "base64"}
+    
+    # all json tools come before the base64 ones
+    sdk_order = [name.split(".")[0] for name in names]
+    assert sdk_order == sorted(sdk_order, key=["json", "base64"].index)
+    assert set(server.tool_registry) == set(names)
+    
+    print("[OK] test 17 passed: server loads sdks in config order")
+    return True
+
+
+def test_server_lazy_schemas():
+    """test 18: test tool schemas are built on the first tools/list."""
+    from server import MCPServer
+    
+    config = Config()
+    config.sdks = ["json"]
+    server = MCPServer(config)
+    
+    assert all("schema" not in tool for tool in server.tools), "schemas should not be built at startup"
+    
+    response = json.loads(server.handle_request({"jsonrpc": "2.0", "id": 1, "method": "tools/list"}))
+    assert response["id"] == 1
+    listed = response["result"]["tools"]
+    dumps = next(tool for tool in listed if tool["name"] == "json.dumps")
+    assert dumps["inputSchema"]["type"] == "object"
+    assert "obj" in dumps["inputSchema"]["required"]
+    assert not server._pending_schemas
+    
+    # the encoded list is kept on the server and rebuilt when tools change
+    cached = server._tools_list_json
+    server.handle_request({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+    assert server._tools_list_json is cached, "repeated lists reuse the encoded result"
+    import inspect
+    changed = dict(server.tools[0], description="changed")
+    server.tools[0] = changed
+    server._pending_schemas.append((changed, inspect.signature(json.dumps), None))
+    listed = json.loads(server.handle_request({"jsonrpc": "2.0", "id": 3, "method": "tools/list"}))["result"]["tools"]
+    assert listed[0]["description"] == "changed" and len(listed) == len(server.tools)
+    
+    # a default that breaks schema generation only affects its own tool
+    import types
+    
+    class Ambiguous:
+        def __ne__(self, other):
+            return self
+        
+        def __bool__(self):
+            raise ValueError("truth value is ambiguous")
+        
+        def __str__(self):
+            raise ValueError("no str")
+    
+    def fetch(x: int, where=Ambiguous()):
+        return x
+    
+    def ping():
+        return "pong"
+    
+    exotic = types.ModuleType("exotic_sdk")
+    fetch.__module__ = ping.__module__ = "exotic_sdk"
+    exotic.fetch = fetch
+    exotic.ping = ping
+    sys.modules["exotic_sdk"] = exotic
+    try:
+        config.sdks = ["json", "exotic_sdk"]
+        server = MCPServer(config)
+        for req_id in (1, 2):
+            response = json.loads(server.handle_request({"jsonrpc": "2.0", "id": req_id, "method": "tools/list"}))
+            listed = {tool["name"]: tool for tool in response["result"]["tools"]}
+            assert "json.dumps" in listed and "exotic_sdk.ping" in listed
+            assert listed["exotic_sdk.fetch"]["inputSchema"] == {"type": "object", "properties": {}}
+        assert not server._pending_schemas
+    finally:
+        del sys.modules["exotic_sdk"]
+    
+    print("[OK] test 18 passed: tool schemas built lazily")
+    return True
+
+
+def test_redact_secrets():
+    """test 19: test secret redaction copies only what it changes."""
+    from safety import redact_secrets
+    
+    clean = {"items": [{"id": 1}, {"id": 2}], "count": 2}
+    assert redact_secrets(clean) is clean, "data without secrets should be returned as-is"
+    
+    shared = {"name": "web"}
+    data = {
+        "pods": [shared, {"name": "db", "auth": {"api_key": "abc", "user": "me"}}],
+        "meta": {"owner": shared},
+        "Token": "xyz"
+    }
+    redacted = redact_secrets(data)
+    
+    assert redacted["Token"] == "***"
+    assert redacted["pods"][1]["auth"] == {"api_key": "***", "user": "me"}
+    assert redacted["meta"] is data["meta"], "untouched branches should not be copied"
+    assert redacted["pods"][0] is shared
+    assert data["Token"] == "xyz" and data["pods"][1]["auth"]["api_key"] == "abc", "input must not be modified"
+    
+    # deep nesting is handled without recursion
+    deep = current = {}
+    for _ in range(5000):
+        current["child"] = {}
+        current = current["child"]
+    current["password"] = "hunter2"
+    result = redact_secrets(deep)
+    for _ in range(5000):
+        result = result["child"]
+    assert result == {"password": "***"}
+    
+    print("[OK] test 19 passed: secret redaction")
+    return True
+
+
+def test_resource_class_discovery():
+    """test 20: test resource classes each get their inherited class methods."""
+    import types
+    
+    class APIResource:
+        @classmethod
+        def retrieve(cls, id: str):
+            return cls, id
+        
+        @property
+        def instance_url(self):
+            return "/v1/x"
+    
+    class Customer(APIResource):
+        @classmethod
+        def list_sources(cls, customer: str):
+            return customer
+    
+    class Charge(APIResource):
+        pass
+    
+    fake_stripe = types.ModuleType("stripe")
+    fake_stripe.Customer = Customer
+    fake_stripe.Charge = Charge
+    
+    methods = discover_methods(fake_stripe, "stripe", allow_dangerous=False)
+    names = {m["name"] for m in methods}
+    
+    assert names == {"stripe.Charge.retrieve", "stripe.Customer.list_sources", "stripe.Customer.retrieve"}
+    by_name = {m["name"]: m for m in methods}
+    assert by_name["stripe.Customer.retrieve"]["callable"]("cus_1") == (Customer, "cus_1")
+    assert by_name["stripe.Charge.retrieve"]["callable"]("ch_1") == (Charge, "ch_1")
+    
+    print("[OK] test 20 passed: resource class discovery")
+    return True
+
+
+def test_server_batches():
+    """test 21: test batches answer every element, rejecting non-objects."""
+    from server import MCPServer
+    from mcp_protocol import encode_response
+    from concurrent.futures import ThreadPoolExecutor
+    
+    config = Config()
+    config.sdks = ["json"]
+    server = MCPServer(config)
+    
+    call = {"jsonrpc": "2.0", "id": 2, "method": "tools/call",
+            "params": {"name": "json.dumps", "arguments": {"obj": [1]}}}
+    batch = [1, call, "x", {"jsonrpc": "2.0", "id": 3, "method": "nope"}]
+    
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for responses in (server.handle_message(batch), server.handle_message(batch, pool)):
+            responses = json.loads(encode_response(responses))
+            assert len(responses) == 4
+            assert responses[0] == {"jsonrpc": "2.0", "error": {"code": -32600, "message": "invalid request"}, "id": None}
+            assert responses[1]["id"] == 2 and responses[1]["result"]["content"][0]["text"] == "[1]"
+            assert responses[2]["error"]["code"] == -32600
+            assert responses[3]["error"]["code"] == -32601 and responses[3]["id"] == 3
+    
+    assert json.loads(server.handle_message(7))["error"]["code"] == -32600
+    assert json.loads(server.handle_message([]))["error"]["code"] == -32600
+    shutdown = server.handle_request({"jsonrpc": "2.0", "id": "s", "method": "shutdown"})
+    assert isinstance(shutdown, bytes), "every response comes back encoded"
+    assert json.loads(shutdown) == {"jsonrpc": "2.0", "result": {}, "id": "s"}
+    
+    print("[OK] test 21 passed: batches reject non-object requests")
+    return True
+
+
+def test_server_transport():
+    """test 22: test stdio framing, in-order replies and exit on shutdown."""
+    import io
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from mcp_protocol import read_requests
+    from server import MCPServer, ToolInfo
+    
+    # frames split across reads, pipelined frames, and a last frame
+    # without a trailing newline
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b'{"id": 1}\n{"id": 2}\n\n{"id": 3}')
+    os.close(write_fd)
+    groups = list(read_requests(read_fd, chunk_size=5))
+    os.close(read_fd)
+    assert [r["id"] for group in groups for r in group] == [1, 2, 3]
+    assert groups[-1] == [{"id": 3}]
+    
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b'{"id": 1}\n{"id": 2}\n')
+    os.close(write_fd)
+    assert list(read_requests(read_fd)) == [[{"id": 1}, {"id": 2}]], "one read yields both requests"
+    os.close(read_fd)
+    
+    class Stdout:
+        def __init__(self):
+            self.buffer = io.BytesIO()
+    
+    def lines(out):
+        return [json.loads(line) for line in out.buffer.getvalue().splitlines()]
+    
+    config = Config()
+    config.sdks = []
+    server = MCPServer(config)
+    
+    def wait(seconds: float):
+        time.sleep(seconds)
+        return seconds
+    
+    server.tool_registry["test.wait"] = ToolInfo(wait, False, "test", lambda arguments: arguments)
+    
+    def call(req_id, seconds):
+        return {"jsonrpc": "2.0", "id": req_id, "method": "tools/call",
+                "params": {"name": "test.wait", "arguments": {"seconds": seconds}}}
+    
+    # pipelined requests finish out of order but are answered in order
+    real_stdout = sys.stdout
+    sys.stdout = Stdout()
+    try:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            messages = [call(1, 0.2), call(2, 0), [call(3, 0.1), call(4, 0)]]
+            server._send_in_order([pool.submit(server.handle_message, m) for m in messages])
+        out = sys.stdout
+    finally:
+        sys.stdout = real_stdout
+    replies = lines(out)
+    assert [replies[0]["id"], replies[1]["id"]] == [1, 2]
+    assert [r["id"] for r in replies[2]] == [3, 4]
+    
+    # run() stops reading once shutdown is answered, though stdin is still
+    # open, whether shutdown comes alone or inside a batch
+    shutdown = {"jsonrpc": "2.0", "id": 2, "method": "shutdown"}
+    for frames in ([call(1, 0), shutdown], [[call(1, 0), shutdown]]):
+        server = MCPServer(config)
+        server.tool_registry["test.wait"] = ToolInfo(wait, False, "test", lambda arguments: arguments)
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, "".join(json.dumps(frame) + "\n" for frame in frames).encode())
+        real_stdin = sys.stdin
+        sys.stdin = io.TextIOWrapper(io.FileIO(read_fd, closefd=False))
+        sys.stdout = Stdout()
+        try:
+            runner = threading.Thread(target=server.run, daemon=True)
+            runner.start()
+            runner.join(timeout=10)
+            out = sys.stdout
+        finally:
+            sys.stdout = real_stdout
+            sys.stdin = real_stdin
+            os.close(write_fd)
+            os.close(read_fd)
+        assert not runner.is_alive(), "server should exit after shutdown"
+        replies = lines(out)
+        if isinstance(frames[0], list):
+            replies = replies[0]
+        assert [r["id"] for r in replies] == [1, 2]
+        assert replies[1]["result"] == {}
+    
+    print("[OK] test 22 passed: stdio transport")
+    return True
+
+
 def run_all_tests():
     """run all core functionality tests."""
     tests = [
@@ -222,7 +867,20 @@ def run_all_tests():
         test_complex_sdk_discovery,
         test_dangerous_method_filtering,
         test_end_to_end_simple_sdk,
-        test_executor_with_retry
+        test_executor_with_retry,
+        test_dry_run_interceptor,
+        test_executor_async_tools,
+        test_executor_execute_many,
+        test_tool_filter,
+        test_rate_limiter,
+        test_executor_cache,
+        test_instance_discovery_skips_properties,
+        test_server_loads_sdks_in_order,
+        test_server_lazy_schemas,
+        test_redact_secrets,
+        test_resource_class_discovery,
+        test_server_batches,
+        test_server_transport
     ]
     
     print("\n" + "="*70)
@@ -23,6 +23,7 @@ class OpenAIMCPAgent:
         self.sdk_name = sdk_name
         self.client = AsyncOpenAI(api_key=openai_api_key)
         self.bridge = None
+        self.owns_bridge = True  # false when the bridge comes from a pool
         self.tools = []
         self.conversation_history = []
         self.model = "gpt-4-turbo-preview"
@@ -73,12 +74,23 @@ EXAMPLE RESPONSES:
 
 remember: you are specifically a {self.sdk_name} expert with exactly {len(self.tools)} tools at your disposal."""
     
-    async def initialize(self):
-        """initialize mcp connection and load tools"""
+    async def initialize(self, bridge: Optional[MCPBridge] = None):
+        """
+        initialize mcp connection and load tools
+        
+        args:
+            bridge: already-started bridge to reuse (e.g. from MCPBridgePool);
+                the caller stays responsible for stopping it
+        """
         try:
-            # create bridge to mcp server
-            self.bridge = MCPBridge(self.sdk_name)
-            await self.bridge.start()
+            if bridge is not None:
+                self.bridge = bridge
+                self.owns_bridge = False
+            else:
+                # create bridge to mcp server
+                self.bridge = MCPBridge(self.sdk_name)
+                self.owns_bridge = True
+                await self.bridge.start()
             
             # fetch available tools
             tools_response = await self.bridge.list_tools()
@@ -126,7 +138,7 @@ remember: you are specifically a {self.sdk_name} expert with exactly {len(self.t
             
         except Exception as e:
             # cleanup on failure
-            if self.bridge:
+            if self.bridge and self.owns_bridge:
                 try:
                     await self.bridge.stop()
                 except:
@@ -198,7 +210,8 @@ remember: you are specifically a {self.sdk_name} expert with exactly {len(self.t
                 ]
             })
             
-            # execute tool calls
+            # collect this turn's tool calls, then execute them as one batch
+            pending = []
             for tool_call in message.tool_calls:
                 openai_tool_name = tool_call.function.name
                 
@@ -215,29 +228,25 @@ remember: you are specifically a {self.sdk_name} expert with exactly {len(self.t
                 if on_tool_call:
                     tool_display = await on_tool_call(mcp_tool_name, arguments)
                 
-                # call tool via mcp
-                try:
-                    result = await self.bridge.call_tool(mcp_tool_name, arguments)
-                    result_str = self._format_tool_result(result)
-                    
-                    # update ui
-                    if tool_display:
-                        tool_display.set_result(result_str)
-                    
-                    # add tool result to history
-                    self.conversation_history.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "name": openai_tool_name,  # use openai name for conversation history
-                        "content": result_str
-                    })
-                    
-                except Exception as e:
-                    error_msg = f"error calling {mcp_tool_name}: {str(e)}"
+                pending.append((tool_call, mcp_tool_name, arguments, tool_display))
+            
+            # call tools via mcp in a single round-trip
+            try:
+                results = await self.bridge.call_tools(
+                    [(mcp_tool_name, arguments) for _, mcp_tool_name, arguments, _ in pending]
+                )
+            except Exception as e:
+                results = [e] * len(pending)
+            
+            for (tool_call, mcp_tool_name, _, tool_display), result in zip(pending, results):
+                openai_tool_name = tool_call.function.name
+                
+                if isinstance(result, Exception):
+                    error_msg = f"error calling {mcp_tool_name}: {str(result)}"
                     
                     # update ui
                     if tool_display:
-                        tool_display.set_error(str(e))
+                        tool_display.set_error(str(result))
                     
                     # add error to history
                     self.conversation_history.append({
@@ -246,6 +255,21 @@ remember: you are specifically a {self.sdk_name} expert with exactly {len(self.t
                         "name": openai_tool_name,  # use openai name for conversation history
                         "content": error_msg
                     })
+                    continue
+                
+                result_str = self._format_tool_result(result)
+                
+                # update ui
+                if tool_display:
+                    tool_display.set_result(result_str)
+                
+                # add tool result to history
+                self.conversation_history.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "name": openai_tool_name,  # use openai name for conversation history
+                    "content": result_str
+                })
             
             # continue loop to let openai synthesize response
         
@@ -304,6 +328,6 @@ remember: you are specifically a {self.sdk_name} expert with exactly {len(self.t
     
     async def cleanup(self):
         """cleanup resources"""
-        if self.bridge:
+        if self.bridge and self.owns_bridge:
             await self.bridge.stop()
 
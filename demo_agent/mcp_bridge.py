@@ -5,9 +5,113 @@ import asyncio
 import json
 import os
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+# prefer uvloop (libuv-backed transports) for faster subprocess pipe i/o.
+# installed as the loop policy at import so asyncio.run() in the tests and
+# textual's app loop both pick it up
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+# 10MB line limit for very large tool lists (kubernetes has 670+ tools)
+STDOUT_LIMIT = 10 * 1024 * 1024
+# only the tail of server stderr is kept for error reporting
+STDERR_KEEP = 64 * 1024
+
+
+class ServerProtocol(asyncio.SubprocessProtocol):
+    """
+    raw subprocess protocol for the mcp server pipes
+    
+    stdout chunks are appended to a single reusable bytearray and lines are
+    sliced out of it directly, instead of going through the default
+    StreamReader machinery (per-chunk feed_data, flow control, waiters)
+    """
+    
+    def __init__(self, limit: int = STDOUT_LIMIT):
+        self.limit = limit
+        self._stdout = bytearray()
+        self._stderr = bytearray()
+        self._scanned = 0  # bytes of _stdout already searched for a newline
+        self._eof = False
+        self._waiter: Optional[asyncio.Future] = None
+        loop = asyncio.get_running_loop()
+        self._exited = loop.create_future()
+        self._stderr_closed = loop.create_future()
+    
+    def pipe_data_received(self, fd: int, data: bytes):
+        if fd == 1:
+            self._stdout += data
+            self._wakeup()
+        elif fd == 2:
+            self._stderr += data
+            if len(self._stderr) > STDERR_KEEP:
+                del self._stderr[:-STDERR_KEEP]
+    
+    def pipe_connection_lost(self, fd: int, exc: Optional[Exception]):
+        # stdout can still hold unread data when the process exits, so only
+        # the pipe closing marks eof
+        if fd == 1:
+            self._eof = True
+            self._wakeup()
+        elif fd == 2 and not self._stderr_closed.done():
+            self._stderr_closed.set_result(None)
+    
+    def process_exited(self):
+        if not self._exited.done():
+            self._exited.set_result(None)
+    
+    def _wakeup(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+    
+    async def readline(self) -> bytes:
+        """read one line from server stdout, b"" on eof"""
+        buf = self._stdout
+        while True:
+            end = buf.find(b"\n", self._scanned)
+            if end >= 0:
+                line = bytes(buf[:end + 1])
+                del buf[:end + 1]
+                self._scanned = 0
+                return line
+            
+            self._scanned = len(buf)
+            if self._eof:
+                line = bytes(buf)
+                buf.clear()
+                self._scanned = 0
+                return line
+            if len(buf) > self.limit:
+                raise ValueError(f"server response line exceeds {self.limit} bytes")
+            
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+    
+    def read_stderr(self) -> bytes:
+        """take whatever server stderr has been received so far"""
+        data = bytes(self._stderr)
+        self._stderr.clear()
+        return data
+    
+    async def stderr_output(self, timeout: float = 1.0) -> bytes:
+        """wait up to `timeout` for server stderr to close, then take it"""
+        await asyncio.wait([self._stderr_closed], timeout=timeout)
+        return self.read_stderr()
+    
+    async def wait(self):
+        """wait for the server process to exit"""
+        # shielded: a timeout around wait() must not cancel the shared future
+        await asyncio.shield(self._exited)
+
 
 class MCPBridge:
     """
@@ -19,7 +123,8 @@ class MCPBridge:
     
     def __init__(self, sdk_name: str):
         self.sdk_name = sdk_name
-        self.process = None
+        self.transport = None
+        self.protocol = None
         self.reader = None
         self.writer = None
         self.request_id = 0
@@ -41,16 +146,17 @@ class MCPBridge:
         env["SDKS"] = self.sdk_name
         env["SDK_NAME"] = self.sdk_name  # for compatibility
         
+        loop = asyncio.get_running_loop()
         try:
             # spawn server process using same python interpreter
-            self.process = await asyncio.create_subprocess_exec(
+            self.transport, self.protocol = await loop.subprocess_exec(
+                ServerProtocol,
                 sys.executable,  # use current python interpreter
                 str(server_path),
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env=env,
-                limit=10 * 1024 * 1024  # 10MB buffer for very large tool lists (kubernetes has 670+ tools)
+                env=env
             )
         except Exception as e:
             raise RuntimeError(
@@ -60,26 +166,50 @@ class MCPBridge:
                 f"Error: {str(e)}"
             ) from e
         
-        self.reader = self.process.stdout
-        self.writer = self.process.stdin
+        self.reader = self.protocol
+        self.writer = self.transport.get_pipe_transport(0)
         
         # wait a moment for server to initialize
         await asyncio.sleep(1.0)  # increased for better stability
         
         # check if process started successfully
-        if self.process.returncode is not None:
-            stderr = await self.process.stderr.read()
+        returncode = self.transport.get_returncode()
+        if returncode is not None:
+            stderr = await self.protocol.stderr_output()
             raise RuntimeError(
                 f"MCP server process failed to start\n"
-                f"Exit code: {self.process.returncode}\n"
+                f"Exit code: {returncode}\n"
                 f"Error: {stderr.decode() if stderr else 'No error output'}"
             )
     
-    async def stop(self):
-        """stop mcp server process"""
-        if self.process:
-            self.process.terminate()
-            await self.process.wait()
+    async def stop(self, grace: float = 0.5):
+        """
+        stop mcp server process
+        
+        asks the server to exit via a shutdown request first; only if it is
+        still running after `grace` seconds is it terminated, then killed
+        """
+        if not self.transport:
+            return
+        
+        if self.transport.get_returncode() is None:
+            try:
+                async with asyncio.timeout(grace):
+                    await self._send_request("shutdown", {})
+                    await self.protocol.wait()
+            except Exception:
+                pass  # server hung or already gone, fall back to signals
+        
+        if self.transport.get_returncode() is None:
+            self.transport.terminate()
+            try:
+                async with asyncio.timeout(grace):
+                    await self.protocol.wait()
+            except TimeoutError:
+                self.transport.kill()
+                await self.protocol.wait()
+        
+        self.transport.close()
     
     async def list_tools(self) -> Dict[str, Any]:
         """fetch available tools from server"""
@@ -95,57 +225,92 @@ class MCPBridge:
                 "arguments": arguments
             }
         )
+        return self._tool_result(response)
+    
+    async def call_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        call several tools in one json-rpc batch
+        
+        sends all requests in a single write and reads one response array,
+        so n calls cost one pipe round-trip. results come back in call
+        order; a failed call yields its Exception instead of raising
+        """
+        if not calls:
+            return []
+        
+        batch = [
+            self._make_request("tools/call", {"name": name, "arguments": arguments})
+            for name, arguments in calls
+        ]
+        responses = await self._exchange(batch, "tools/call (batch)")
         
+        if not isinstance(responses, list):
+            # server rejected the batch as a whole
+            error = responses.get("error", {})
+            raise Exception(f"{error.get('message', 'unknown error')}")
+        
+        by_id = {response.get("id"): response for response in responses}
+        results = []
+        for request in batch:
+            response = by_id.get(request["id"])
+            if response is None:
+                results.append(Exception(f"no response for {request['params']['name']}"))
+                continue
+            try:
+                results.append(self._tool_result(response))
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    def _tool_result(self, response: Dict[str, Any]) -> Any:
+        """unwrap a tools/call response, raising on json-rpc errors"""
         # check for errors
         if "error" in response:
             error = response["error"]
             raise Exception(f"{error.get('message', 'unknown error')}")
         
         # extract result
-        result = response.get("result", {})
-        
-        # handle both direct results and wrapped results
-        if isinstance(result, dict) and "content" in result:
-            # mcp format with content array
-            content = result.get("content", [])
-            if content and isinstance(content, list):
-                return content[0].get("text", str(result))
+        result = response.get("result")
+        if result is None:
+            return {}
         
-        return result
+        # mcp format with content array is the common case; anything else
+        # is returned as-is
+        try:
+            return result["content"][0]["text"]
+        except (KeyError, TypeError, IndexError):
+            return result
     
-    async def _send_request(self, method: str, params: Any) -> Dict[str, Any]:
-        """send json-rpc request and get response"""
+    def _make_request(self, method: str, params: Any) -> Dict[str, Any]:
+        """build a json-rpc request with the next id"""
         self.request_id += 1
         
-        request = {
+        return {
             "jsonrpc": "2.0",
             "method": method,
             "params": params,
             "id": self.request_id
         }
-        
+    
+    async def _send_request(self, method: str, params: Any) -> Dict[str, Any]:
+        """send json-rpc request and get response"""
+        return await self._exchange(self._make_request(method, params), method)
+    
+    async def _exchange(self, payload: Any, method: str) -> Any:
+        """write one json-rpc frame (request or batch) and read one back"""
         try:
             # send request
-            request_json = json.dumps(request) + "\n"
+            request_json = json.dumps(payload) + "\n"
             self.writer.write(request_json.encode())
-            await self.writer.drain()
             
-            # read response with timeout
-            response_line = await asyncio.wait_for(
-                self.reader.readline(),
-                timeout=30.0
-            )
+            # read response with timeout (asyncio.timeout avoids wrapping
+            # the read in a new task like wait_for does)
+            async with asyncio.timeout(30.0):
+                response_line = await self.reader.readline()
             
             if not response_line:
                 # check stderr for errors
-                stderr_data = b""
-                try:
-                    stderr_data = await asyncio.wait_for(
-                        self.process.stderr.read(4096),
-                        timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    pass
+                stderr_data = (await self.protocol.stderr_output())[-4096:]
                 
                 if stderr_data:
                     raise Exception(f"server error: {stderr_data.decode()}")
@@ -162,7 +327,7 @@ class MCPBridge:
             
             return response
             
-        except asyncio.TimeoutError:
+        except TimeoutError:
             raise Exception(
                 f"timeout waiting for response from server\n"
                 f"Method: {method}\n"
@@ -185,8 +350,11 @@ class MCPBridgePool:
     def __init__(self):
         self.bridges: Dict[str, MCPBridge] = {}
     
-    async def get_bridge(self, sdk_name: str) -> MCPBridge:
-        """get or create bridge for sdk"""
+    async def get_bridge(self, sdk_name: str, force_fresh: bool = False) -> MCPBridge:
+        """get or create bridge for sdk (force_fresh restarts its server)"""
+        if force_fresh and sdk_name in self.bridges:
+            await self.bridges.pop(sdk_name).stop()
+        
         if sdk_name not in self.bridges:
             bridge = MCPBridge(sdk_name)
             await bridge.start()
@@ -195,8 +363,7 @@ class MCPBridgePool:
         return self.bridges[sdk_name]
     
     async def cleanup(self):
-        """stop all bridges"""
-        for bridge in self.bridges.values():
-            await bridge.stop()
+        """stop all bridges (shutdowns run concurrently)"""
+        await asyncio.gather(*(bridge.stop() for bridge in self.bridges.values()))
         self.bridges.clear()
 
@@ -52,6 +52,11 @@ async def test_bridge():
         result = await bridge.call_tool('os.getenv', {'key': 'HOME'})
         print(f"   [OK] result: {result}")
         
+        # test batched calls (single round-trip)
+        print("   - calling os.getcwd() and os.cpu_count() as one batch...")
+        results = await bridge.call_tools([('os.getcwd', {}), ('os.cpu_count', {})])
+        print(f"   [OK] results: {results}")
+        
         print("\n3. stopping server...")
         await bridge.stop()
         print("   [OK] server stopped cleanly")
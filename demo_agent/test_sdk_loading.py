@@ -10,6 +10,10 @@ if 'OPENAI_API_KEY' not in os.environ:
     sys.exit(1)
 
 from agent import OpenAIMCPAgent
+from mcp_bridge import MCPBridgePool
+
+# shared pool so server processes stay warm across agents and retries
+pool = MCPBridgePool()
 
 async def test_sdk_loading():
     """test that different sdks load different tool counts"""
@@ -26,7 +30,7 @@ async def test_sdk_loading():
         try:
             print(f"loading {sdk_name} ({description})...")
             agent = OpenAIMCPAgent(sdk_name, os.environ['OPENAI_API_KEY'])
-            await agent.initialize()
+            await agent.initialize(await pool.get_bridge(sdk_name))
             tool_count = len(agent.tools)
             print(f"[OK] {sdk_name}: loaded {tool_count} tools")
             
@@ -42,6 +46,8 @@ async def test_sdk_loading():
         except Exception as e:
             print(f"[FAIL] {sdk_name}: error - {str(e)}\n")
     
+    await pool.cleanup()
+    
     print("\nif tool counts are different, the backend is working correctly!")
 
 if __name__ == '__main__':
@@ -1,47 +1,165 @@
 """execution with retry logic."""
+import re
 import time
+import random
 import asyncio
 import inspect
+import threading
+from collections import OrderedDict
 from functools import wraps
 
 
-def with_retry(max_retries=3):
+# errors worth retrying: matched by type first, then by message
+_RETRYABLE_TYPES = (TimeoutError, ConnectionError)
+_RETRYABLE_RE = re.compile(
+    r"timeout|connection|temporar|network|rate limit|too many requests|\b(?:429|503)\b",
+    re.IGNORECASE
+)
+
+
+def _is_retryable(error):
+    """check if an error looks transient."""
+    return isinstance(error, _RETRYABLE_TYPES) or _RETRYABLE_RE.search(str(error)) is not None
+
+
+def _backoff(attempt, base, cap, jitter):
+    """exponential backoff delay, randomized so concurrent callers spread out."""
+    wait_time = min(cap, base * (2 ** attempt))
+    if jitter:
+        wait_time *= random.uniform(0.5, 1.5)
+    return wait_time
+
+
+async def _retry_async(func, args, kwargs, max_retries, base=1.0, cap=30.0, jitter=True):
+    """await func(*args, **kwargs), retrying transient errors."""
+    last_error = None
+    for attempt in range(max_retries):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            last_error = e
+            if not _is_retryable(e):
+                raise
+            if attempt < max_retries - 1:
+                await asyncio.sleep(_backoff(attempt, base, cap, jitter))
+    raise last_error
+
+
+def _retry_sync(func, args, kwargs, max_retries, base=1.0, cap=30.0, jitter=True):
+    """call func(*args, **kwargs), retrying transient errors."""
+    last_error = None
+    for attempt in range(max_retries):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            last_error = e
+            if not _is_retryable(e):
+                raise
+            if attempt < max_retries - 1:
+                time.sleep(_backoff(attempt, base, cap, jitter))
+    raise last_error
+
+
+def with_retry(max_retries=3, base=1.0, cap=30.0, jitter=True):
     """decorator for retry logic."""
     def decorator(func):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            last_error = None
-            for attempt in range(max_retries):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    last_error = e
-                    error_str = str(e).lower()
-                    if not any(x in error_str for x in ['timeout', 'connection', 'temporary']):
-                        raise
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)
-            raise last_error
+            return await _retry_async(func, args, kwargs, max_retries, base, cap, jitter)
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            last_error = None
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_error = e
-                    error_str = str(e).lower()
-                    if not any(x in error_str for x in ['timeout', 'connection', 'temporary']):
-                        raise
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-            raise last_error
+            return _retry_sync(func, args, kwargs, max_retries, base, cap, jitter)
         
         return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
     return decorator
 
 
+# sentinel for cache misses, since None is a valid cached result
+_MISSING = object()
+
+# most results SimpleCache holds before evicting the least recently used
+MAX_CACHE_ENTRIES = 1024
+
+
+def _make_key(tool_name, arguments):
+    """cache key for a call: a plain tuple when arguments are hashable, None if uncacheable."""
+    # value types keep 1, True and 1.0 apart, which compare (and hash) equal
+    key = (tool_name, tuple((k, type(v), v) for k, v in sorted(arguments.items())))
+    try:
+        hash(key)
+    except TypeError:
+        # lists/dicts in arguments
+        try:
+            key = (tool_name, _freeze(arguments))
+        except TypeError:
+            return None  # a value with no exact hashable form, don't cache
+    return key
+
+
+def _freeze(value):
+    """
+    hashable stand-in for a value, tagged with types all the way down.
+    
+    unlike a json encoding, distinct values never share a key because
+    their str() or json form happens to match (Decimal("1") and "1").
+    """
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(map(_freeze, value)))
+    if isinstance(value, dict):
+        return (type(value), frozenset((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(map(_freeze, value)))
+    hash(value)  # raises TypeError for other unhashable values
+    return (type(value), value)
+
+
+class SimpleCache:
+    """in-memory lru result cache with per-entry ttl."""
+    
+    def __init__(self, default_ttl=300, max_size=MAX_CACHE_ENTRIES):
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        # key -> (expires_at, value), least recently used first. expired
+        # entries are dropped when looked up or pushed out by lru order
+        self._entries = OrderedDict()
+        # tool calls run on several threads; reordering isn't atomic
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        """cached value for key, or _MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def set(self, key, value, ttl=None):
+        """cache value for ttl seconds (default_ttl if not given)."""
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def stats(self):
+        """cache statistics."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
 class Executor:
     """executes sdk methods with retry."""
     
@@ -49,26 +167,116 @@ class Executor:
         self.config = config
         self.max_retries = getattr(config, 'max_retries', 3)
         self.timeout = getattr(config, 'timeout_seconds', 30)
+        self.cache = None
+        if getattr(config, 'enable_cache', False):
+            self.cache = SimpleCache(getattr(config, 'cache_ttl', 300))
+        # event loop for async tools, started on first use and reused
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+        # id(callable) -> (callable, is coroutine function); holding the
+        # callable keeps its id from being reused by another object
+        self._coro_cache = {}
     
-    def execute(self, callable_obj, arguments):
-        """execute callable with retry."""
-        if inspect.iscoroutinefunction(callable_obj):
-            return asyncio.run(self._execute_async(callable_obj, arguments))
+    def _is_coroutine(self, callable_obj):
+        """cached inspect.iscoroutinefunction."""
+        entry = self._coro_cache.get(id(callable_obj))
+        if entry is None:
+            entry = (callable_obj, inspect.iscoroutinefunction(callable_obj))
+            self._coro_cache[id(callable_obj)] = entry
+        return entry[1]
+    
+    def execute(self, callable_obj, arguments, tool_name=None):
+        """
+        execute callable with retry.
+        
+        when caching is enabled, results are cached under tool_name and
+        arguments; leave tool_name as None for calls that must always run.
+        """
+        key = None
+        if self.cache is not None and tool_name is not None:
+            key = _make_key(tool_name, arguments)
+            cached = self.cache.get(key)
+            if cached is not _MISSING:
+                return cached
+        
+        if self._is_coroutine(callable_obj):
+            future = asyncio.run_coroutine_threadsafe(
+                self._execute_async(callable_obj, arguments),
+                self._background_loop()
+            )
+            result = future.result()
         else:
-            return self._execute_sync(callable_obj, arguments)
+            result = self._execute_sync(callable_obj, arguments)
+        
+        if key is not None:
+            self.cache.set(key, result)
+        return result
+    
+    async def execute_many_async(self, items):
+        """
+        execute (tool_name, callable, arguments) items concurrently.
+        
+        yields (index, tool_name, result) as each call finishes, so callers
+        get early results; a failed call yields its exception as the result.
+        sync tools run in the default thread pool so they don't block the
+        loop, which helps i/o-bound calls but not cpu-bound ones.
+        """
+        async def run_one(index, tool_name, callable_obj, arguments):
+            try:
+                if self._is_coroutine(callable_obj):
+                    result = await self._execute_async(callable_obj, arguments)
+                else:
+                    result = await asyncio.to_thread(self._execute_sync, callable_obj, arguments)
+            except Exception as e:
+                result = e
+            return index, tool_name, result
+        
+        pending = [run_one(i, *item) for i, item in enumerate(items)]
+        for next_done in asyncio.as_completed(pending):
+            yield await next_done
+    
+    def execute_many(self, items):
+        """execute items concurrently, returning results in item order."""
+        items = list(items)
+        
+        async def collect():
+            results = [None] * len(items)
+            async for index, _, result in self.execute_many_async(items):
+                results[index] = result
+            return results
+        
+        future = asyncio.run_coroutine_threadsafe(collect(), self._background_loop())
+        return future.result()
+    
+    def close(self):
+        """stop the background event loop, if one was started."""
+        with self._loop_lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+    
+    def _background_loop(self):
+        """get the shared event loop, starting its thread if needed."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="executor-loop",
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
     
     def _execute_sync(self, callable_obj, arguments):
         """execute sync callable with retry."""
-        @with_retry(self.max_retries)
-        def wrapped():
-            return callable_obj(**arguments)
-        
-        return wrapped()
+        return _retry_sync(callable_obj, (), arguments, self.max_retries)
     
     async def _execute_async(self, callable_obj, arguments):
         """execute async callable with retry."""
-        @with_retry(self.max_retries)
-        async def wrapped():
-            return await callable_obj(**arguments)
-        
-        return await wrapped()
+        return await _retry_async(callable_obj, (), arguments, self.max_retries)
@@ -0,0 +1,68 @@
+"""allowlist/denylist filtering of tool names."""
+import fnmatch
+import re
+
+
+# most decisions remembered per filter
+MAX_CACHED_DECISIONS = 4096
+
+
+# characters that make a pattern a glob rather than an exact tool name
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _compile_patterns(patterns):
+    """
+    split patterns into (exact names, one regex for the globs).
+    
+    exact names are checked with a set lookup; the regex is None when
+    there are no globs.
+    """
+    exact = frozenset(p for p in patterns if _GLOB_CHARS.isdisjoint(p))
+    globs = [p for p in patterns if p not in exact]
+    if not globs:
+        return exact, None
+    return exact, re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs))
+
+
+def _matches_any(tool_name, exact, regex):
+    """check a tool name against compiled patterns."""
+    return tool_name in exact or (regex is not None and regex.match(tool_name) is not None)
+
+
+class ToolFilter:
+    """filters tools by glob patterns like "os.*" or "*.delete_*"."""
+    
+    def __init__(self, allowlist=None, denylist=None):
+        self.allowlist = list(allowlist or [])
+        self.denylist = list(denylist or [])
+        # exact names are a set lookup; all globs of a list are matched in
+        # a single regex pass
+        self._allow_exact, self._allow_re = _compile_patterns(self.allowlist)
+        self._deny_exact, self._deny_re = _compile_patterns(self.denylist)
+        # tool name -> decision, filled until MAX_CACHED_DECISIONS
+        self._decisions = {}
+    
+    def should_include(self, tool_name):
+        """check if a tool passes the allowlist and denylist."""
+        decision = self._decisions.get(tool_name)
+        if decision is None:
+            decision = self._matches(tool_name)
+            if len(self._decisions) < MAX_CACHED_DECISIONS:
+                self._decisions[tool_name] = decision
+        return decision
+    
+    def _matches(self, tool_name):
+        """run the compiled patterns against a tool name."""
+        if self.allowlist and not _matches_any(tool_name, self._allow_exact, self._allow_re):
+            return False
+        if self.denylist and _matches_any(tool_name, self._deny_exact, self._deny_re):
+            return False
+        return True
+    
+    def filter_tools(self, tools):
+        """keep only the tools that should be included."""
+        if not self.allowlist and not self.denylist:
+            # nothing configured (the default): every tool passes
+            return list(tools)
+        return [tool for tool in tools if self.should_include(tool["name"])]
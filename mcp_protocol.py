@@ -1,41 +1,213 @@
 """simple mcp protocol implementation over stdio."""
+import datetime
+import enum
 import json
+import math
+import os
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj):
+    """serialize to json bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits, let the stdlib handle it
+    return json.dumps(obj).encode()
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def encode_response(response):
+    """json bytes for a response, a batch of responses, or pre-encoded bytes."""
+    if isinstance(response, bytes):
+        return response
+    if isinstance(response, list):
+        return b"[" + b",".join(map(encode_response, response)) + b"]"
+    return _dumps(response)
+
 
 def send_response(response):
     """send json response to stdout."""
-    print(json.dumps(response), flush=True)
+    out = sys.stdout.buffer
+    out.write(encode_response(response) + b"\n")
+    out.flush()
+
+
+def send_responses(responses):
+    """send several json responses to stdout in a single write."""
+    out = sys.stdout.buffer
+    out.write(b"".join([encode_response(response) + b"\n" for response in responses]))
+    out.flush()
 
 
 def read_request():
     """read json request from stdin."""
-    line = sys.stdin.readline()
+    line = sys.stdin.buffer.readline()
     if not line:
         return None
-    return json.loads(line.strip())
+    return _loads(line)
+
+
+def read_requests(fd=None, chunk_size=65536):
+    """
+    yield groups of json requests from stdin until eof.
+    
+    each os.read returns whatever the client has written so far, so
+    pipelined requests arrive together and can be handled as a group
+    instead of one readline at a time.
+    """
+    if fd is None:
+        fd = sys.stdin.fileno()
+    buf = bytearray()
+    
+    while True:
+        chunk = os.read(fd, chunk_size)
+        if not chunk:
+            break
+        buf += chunk
+        
+        end = buf.rfind(b"\n")
+        if end < 0:
+            continue
+        lines = buf[:end].split(b"\n")
+        del buf[:end + 1]
+        
+        requests = [_loads(line) for line in lines if line.strip()]
+        if requests:
+            yield requests
+    
+    # last request may not be newline terminated
+    if buf.strip():
+        yield [_loads(buf)]
+
+
+def tools_list_result(tools):
+    """tools/list result for a list of tools."""
+    return {
+        "tools": [
+            {
+                "name": tool["name"],
+                "description": tool.get("description", ""),
+                "inputSchema": tool.get("schema", {})
+            }
+            for tool in tools
+        ]
+    }
 
 
 def handle_tools_list(tools):
     """handle tools/list request."""
+    return {
+        "jsonrpc": "2.0",
+        "result": tools_list_result(tools)
+    }
+
+
+def encode_tools_list_result(tools):
+    """serialized tools/list result, for callers that reuse it across requests."""
+    return _dumps(tools_list_result(tools))
+
+
+def encode_tools_list(result_json, req_id):
+    """serialized tools/list response around a result from encode_tools_list_result."""
+    return b'{"jsonrpc":"2.0","result":' + result_json + b',"id":' + _dumps(req_id) + b"}"
+
+
+def encode_empty_result(req_id):
+    """serialized success response with an empty result, e.g. for shutdown."""
+    return b'{"jsonrpc":"2.0","result":{},"id":' + _dumps(req_id) + b"}"
+
+
+def _json_default(obj):
+    """json for values outside the json types, written as orjson writes them."""
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    return str(obj)
+
+
+def _finite(obj):
+    """copy of obj with nan and infinity as None, which orjson writes as null."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_text(result):
+    """compact stdlib json matching orjson's output."""
+    return json.dumps(result, default=_json_default, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def _result_text(result):
+    """text content for a tool result: json for dicts/lists, str() otherwise."""
+    if isinstance(result, (dict, list, tuple)):
+        # one c-level encode instead of python's recursive repr
+        if orjson is not None:
+            try:
+                return orjson.dumps(result, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                pass  # e.g. ints beyond 64 bits, let the stdlib handle it
+        try:
+            return _stdlib_text(result)
+        except ValueError:
+            # nan/infinity (or a circular reference, which _finite can't copy)
+            try:
+                return _stdlib_text(_finite(result))
+            except (TypeError, ValueError, RecursionError):
+                pass
+        except TypeError:
+            pass  # e.g. tuple keys; fall back to str()
+    return str(result)
+
+
+def tool_result_response(result):
+    """build a tools/call success response around a result."""
     return {
         "jsonrpc": "2.0",
         "result": {
-            "tools": [
-                {
-                    "name": tool["name"],
-                    "description": tool.get("description", ""),
-                    "inputSchema": tool.get("schema", {})
-                }
-                for tool in tools
-            ]
+            "content": [{"type": "text", "text": _result_text(result)}]
         }
     }
 
 
+# tools/call success frame, filled with the json of the result text and id
+_TOOL_RESULT_TEMPLATE = b'{"jsonrpc":"2.0","result":{"content":[{"type":"text","text":%s}]},"id":%s}'
+
+
+def encode_tool_result(result, req_id):
+    """serialized tools/call success response, built without the response dicts."""
+    return _TOOL_RESULT_TEMPLATE % (_dumps(_result_text(result)), _dumps(req_id))
+
+
+# json-rpc error frames, filled with the code, json message (and data) and json id
+_ERROR_TEMPLATE = b'{"jsonrpc":"2.0","error":{"code":%d,"message":%s},"id":%s}'
+_ERROR_DATA_TEMPLATE = b'{"jsonrpc":"2.0","error":{"code":%d,"message":%s,"data":%s},"id":%s}'
+
+
+def encode_error(code, message, req_id, data=None):
+    """serialized json-rpc error response, with optional error data."""
+    if data is None:
+        return _ERROR_TEMPLATE % (code, _dumps(message), _dumps(req_id))
+    return _ERROR_DATA_TEMPLATE % (code, _dumps(message), _dumps(data), _dumps(req_id))
+
+
 def handle_tools_call(tool_name, arguments, tool_registry):
     """handle tools/call request."""
-    if tool_name not in tool_registry:
+    tool = tool_registry.get(tool_name)
+    if tool is None:
         return {
             "jsonrpc": "2.0",
             "error": {
@@ -45,13 +217,7 @@ def handle_tools_call(tool_name, arguments, tool_registry):
         }
     
     try:
-        result = tool_registry[tool_name](**arguments)
-        return {
-            "jsonrpc": "2.0",
-            "result": {
-                "content": [{"type": "text", "text": str(result)}]
-            }
-        }
+        return tool_result_response(tool(**arguments))
     except Exception as e:
         return {
             "jsonrpc": "2.0",
@@ -60,4 +226,3 @@ def handle_tools_call(tool_name, arguments, tool_registry):
                 "message": str(e)
             }
         }
-
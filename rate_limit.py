@@ -0,0 +1,82 @@
+"""rate limiting for tool calls."""
+import threading
+import time
+
+
+# sweep idle buckets once every this many checks
+EVICT_EVERY = 1024
+
+
+class RateLimiter:
+    """token bucket per key: bursts of max_calls, refilled over time_window."""
+    
+    def __init__(self, max_calls=100, time_window=60):
+        self.max_calls = max_calls
+        self.time_window = time_window
+        self._rate = max_calls / time_window  # tokens per second
+        # key -> [tokens, last_refill]; monotonic clock so wall-clock jumps
+        # can't empty or overfill a bucket
+        self._buckets = {}
+        self.total_blocked = 0
+        self._checks = 0
+        # tool calls run on several threads; refill/take and eviction are
+        # read-modify-write on shared buckets
+        self._lock = threading.Lock()
+    
+    def check_limit(self, key="default"):
+        """take a token for key, returning False if none are left."""
+        now = time.monotonic()
+        with self._lock:
+            self._checks += 1
+            if self._checks % EVICT_EVERY == 0:
+                self._evict(now)
+            
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.max_calls, now]
+            
+            bucket[0] = min(self.max_calls, bucket[0] + (now - bucket[1]) * self._rate)
+            bucket[1] = now
+            
+            if bucket[0] < 1:
+                self.total_blocked += 1
+                return False
+            
+            bucket[0] -= 1
+            return True
+    
+    def get_remaining(self, key="default"):
+        """calls key could make right now."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return self.max_calls
+            tokens = bucket[0] + (time.monotonic() - bucket[1]) * self._rate
+        return int(min(self.max_calls, tokens))
+    
+    def maybe_evict(self, now=None):
+        """
+        drop buckets idle for a full window.
+        
+        such a bucket has refilled to max_calls, so recreating it on the
+        next call behaves the same; this only stops stale keys piling up.
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            return self._evict(now)
+    
+    def _evict(self, now):
+        """drop idle buckets; caller holds the lock."""
+        cutoff = now - self.time_window
+        idle = [key for key, bucket in self._buckets.items() if bucket[1] <= cutoff]
+        for key in idle:
+            del self._buckets[key]
+        return len(idle)
+    
+    def stats(self):
+        """rate limiter statistics."""
+        return {
+            "keys": len(self._buckets),
+            "total_blocked": self.total_blocked
+        }
@@ -2,10 +2,52 @@
 import inspect
 import json
 import os
+from functools import lru_cache
+
+
+# python type -> json schema type
+_TYPE_MAP = {
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    str: "string",
+    list: "array",
+    dict: "object"
+}
+
+# property schemas that are just a type are shared by every tool. schemas
+# are treated as read-only once built, so never modify these in place
+_TYPE_SCHEMA = {json_type: {"type": json_type} for json_type in set(_TYPE_MAP.values())}
 
 
 def signature_to_schema(sig, docstring=None, use_llm=False):
     """convert python signature to json schema."""
+    # generated sdks repeat the same signature and docstring across many
+    # methods, so plain schemas are memoized. default types and reprs are
+    # part of the key since 1 == True and (0,) == (False,) would otherwise
+    # share a schema
+    try:
+        defaults = tuple((type(p.default), repr(p.default)) for p in sig.parameters.values())
+        schema = _cached_schema((sig, docstring, defaults))
+    except TypeError:
+        # unhashable default or annotation
+        schema = _build_schema(sig, docstring)
+    
+    # enhance with llm if enabled
+    if use_llm and os.getenv("OPENAI_API_KEY"):
+        schema = _enhance_schema_with_llm(schema, docstring)
+    
+    return schema
+
+
+@lru_cache(maxsize=8192)
+def _cached_schema(key):
+    """schema for a (signature, docstring, default types and reprs) key."""
+    return _build_schema(key[0], key[1])
+
+
+def _build_schema(sig, docstring):
+    """build the json schema for a signature."""
     properties = {}
     required = []
     
@@ -30,7 +72,8 @@ def signature_to_schema(sig, docstring=None, use_llm=False):
                 prop["description"] = desc
         
         # handle defaults
-        if param.default != inspect.Parameter.empty:
+        # identity, since a default's != may not return a bool (numpy arrays)
+        if param.default is not inspect.Parameter.empty:
             try:
                 # test if default is json serializable
                 json.dumps(param.default)
@@ -41,19 +84,13 @@ def signature_to_schema(sig, docstring=None, use_llm=False):
         else:
             required.append(param_name)
         
-        properties[param_name] = prop
+        properties[param_name] = _TYPE_SCHEMA[param_type] if len(prop) == 1 else prop
     
-    schema = {
+    return {
         "type": "object",
         "properties": properties,
         "required": required
     }
-    
-    # enhance with llm if enabled
-    if use_llm and os.getenv("OPENAI_API_KEY"):
-        schema = _enhance_schema_with_llm(schema, docstring)
-    
-    return schema
 
 
 def _get_json_type(annotation):
@@ -61,22 +98,13 @@ def _get_json_type(annotation):
     if annotation == inspect.Parameter.empty:
         return "string"
     
-    type_map = {
-        int: "integer",
-        float: "number",
-        bool: "boolean",
-        str: "string",
-        list: "array",
-        dict: "object"
-    }
-    
     # handle typing generics
     if hasattr(annotation, "__origin__"):
         origin = annotation.__origin__
-        if origin in type_map:
-            return type_map[origin]
+        if origin in _TYPE_MAP:
+            return _TYPE_MAP[origin]
     
-    return type_map.get(annotation, "string")
+    return _TYPE_MAP.get(annotation, "string")
 
 
 def _extract_param_description(docstring, param_name):
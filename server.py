@@ -1,12 +1,50 @@
 """minimal mcp server."""
 import importlib
 import sys
-from mcp_protocol import read_request, send_response, handle_tools_list
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from mcp_protocol import read_requests, send_response, send_responses, encode_tools_list_result, encode_tools_list, encode_tool_result, encode_empty_result, encode_error
 from reflection import discover_methods
 from schema_gen import signature_to_schema
 from auth import AuthManager
 from safety import redact_secrets
 from executor import Executor
+from dry_run import DryRunInterceptor
+from filters import ToolFilter
+from rate_limit import RateLimiter
+
+
+# threads handling requests that arrive together (pipelined or batched)
+MAX_CONCURRENT_REQUESTS = 8
+
+# sdk modules already imported by a server in this process
+_MODULE_CACHE = {}
+
+
+def _import_sdk(module_name):
+    """import an sdk module, reusing earlier imports."""
+    module = _MODULE_CACHE.get(module_name)
+    if module is None:
+        module = _MODULE_CACHE[module_name] = importlib.import_module(module_name)
+    return module
+
+
+def _is_shutdown(message):
+    """whether a stdin message is, or is a batch containing, a shutdown request."""
+    requests = message if isinstance(message, list) else [message]
+    return any(isinstance(request, dict) and request.get("method") == "shutdown" for request in requests)
+
+
+class ToolInfo:
+    """what tools/call needs to know about a registered tool."""
+    
+    __slots__ = ("callable", "is_dangerous", "sdk_name", "inject_auth")
+    
+    def __init__(self, callable_obj, is_dangerous, sdk_name, inject_auth):
+        self.callable = callable_obj
+        self.is_dangerous = is_dangerous
+        self.sdk_name = sdk_name  # top-level package, keys rate limits
+        self.inject_auth = inject_auth  # the sdk's auth provider, resolved once
 
 
 class MCPServer:
@@ -15,48 +53,118 @@ class MCPServer:
     def __init__(self, config):
         self.config = config
         self.tools = []
-        self.tool_registry = {}
+        self.tool_registry = {}  # tool name -> ToolInfo
+        # (tool, signature, docstring) for tools whose input schema is built
+        # on the first tools/list rather than at startup
+        self._pending_schemas = []
+        self._schema_lock = threading.Lock()
+        # encoded tools/list result, reset whenever the tools change
+        self._tools_list_json = None
         self.auth_manager = AuthManager()
         self.executor = Executor(config)
+        self.dry_run = DryRunInterceptor(enabled=config.dry_run)
+        self.tool_filter = ToolFilter(config.tool_allowlist, config.tool_denylist)
+        self.rate_limiter = None
+        if config.enable_rate_limit:
+            self.rate_limiter = RateLimiter(config.rate_limit_calls, config.rate_limit_window)
         self._load_sdks()
     
     def _load_sdks(self):
         """load configured sdks."""
-        for module_name in self.config.sdks:
-            try:
-                module = importlib.import_module(module_name)
-                methods = discover_methods(module, module_name, self.config.allow_dangerous)
+        sdks = list(self.config.sdks)
+        if not sdks:
+            return
+        
+        # imports and discovery are independent per sdk, so run them
+        # side by side; results are merged here in config order
+        with ThreadPoolExecutor(max_workers=min(8, len(sdks))) as pool:
+            futures = [pool.submit(self._load_one_sdk, module_name) for module_name in sdks]
+            
+            for module_name, future in zip(sdks, futures):
+                try:
+                    methods, tools = future.result()
+                except Exception as e:
+                    print(f"[FAIL] {module_name}: {e}", file=sys.stderr)
+                    continue
                 
-                for method in methods:
-                    schema = signature_to_schema(method["signature"], method.get("docstring"))
-                    
-                    tool = {
-                        "name": method["name"],
-                        "description": method.get("docstring", ""),
-                        "schema": schema
-                    }
-                    
+                sdk_name = sys.intern(module_name.split(".")[0])
+                inject_auth = self.auth_manager.get_provider(sdk_name).inject
+                for method, tool in zip(methods, tools):
                     self.tools.append(tool)
-                    self.tool_registry[method["name"]] = method["callable"]
+                    self._pending_schemas.append((tool, method["signature"], method["docstring"]))
+                    self.tool_registry[tool["name"]] = ToolInfo(
+                        method["callable"], method["is_dangerous"], sdk_name, inject_auth
+                    )
                 
                 print(f"[OK] loaded {module_name}: {len(methods)} methods", file=sys.stderr)
-            
-            except Exception as e:
-                print(f"[FAIL] {module_name}: {e}", file=sys.stderr)
+        
+        self._tools_list_json = None
+    
+    def _load_one_sdk(self, module_name):
+        """import one sdk and build its tools, returns (methods, tools)."""
+        module = _import_sdk(module_name)
+        methods = discover_methods(module, module_name, self.config.allow_dangerous)
+        methods = self.tool_filter.filter_tools(methods)
+        
+        # schemas are filled in by _ensure_schemas when first listed.
+        # names are interned: one copy shared by the tool list and registry
+        tools = [
+            {"name": sys.intern(method["name"]), "description": method["docstring"]}
+            for method in methods
+        ]
+        
+        return methods, tools
+    
+    def _ensure_schemas(self):
+        """build input schemas for tools that haven't been listed yet."""
+        if not self._pending_schemas:
+            return
+        
+        with self._schema_lock:
+            try:
+                for tool, sig, docstring in self._pending_schemas:
+                    try:
+                        tool["schema"] = signature_to_schema(sig, docstring)
+                    except Exception as e:
+                        # e.g. a default whose comparison or str() raises; one
+                        # bad signature must not break tools/list for every sdk
+                        print(f"[FAIL] {tool['name']}: {e}", file=sys.stderr)
+                        tool["schema"] = {"type": "object", "properties": {}}
+            finally:
+                self._pending_schemas.clear()
+                self._tools_list_json = None
+    
+    def _tools_list(self):
+        """encoded tools/list result, built once until the tools change."""
+        self._ensure_schemas()
+        result_json = self._tools_list_json
+        if result_json is None:
+            result_json = self._tools_list_json = encode_tools_list_result(self.tools)
+        return result_json
     
     def execute_tool(self, tool_name, arguments):
         """execute a tool."""
-        if tool_name not in self.tool_registry:
+        tool_info = self.tool_registry.get(tool_name)
+        if tool_info is None:
             raise ValueError(f"tool not found: {tool_name}")
+        callable_obj = tool_info.callable
         
-        callable_obj = self.tool_registry[tool_name]
+        # dry run: record dangerous calls instead of running them
+        if self.dry_run.should_intercept(tool_name, tool_info.is_dangerous):
+            return self.dry_run.intercept(tool_name, callable_obj, arguments)
+        
+        sdk_name = tool_info.sdk_name
+        
+        # rate limit per sdk
+        if self.rate_limiter and not self.rate_limiter.check_limit(sdk_name):
+            raise RuntimeError(f"rate limit exceeded for {sdk_name}")
         
         # inject auth
-        sdk_name = tool_name.split(".")[0]
-        arguments = self.auth_manager.inject_auth(sdk_name, arguments)
+        arguments = tool_info.inject_auth(arguments)
         
-        # execute
-        result = self.executor.execute(callable_obj, arguments)
+        # execute (dangerous calls have side effects, never serve them from cache)
+        cache_name = None if tool_info.is_dangerous else tool_name
+        result = self.executor.execute(callable_obj, arguments, cache_name)
         
         # redact secrets
         if self.config.redact_secrets:
@@ -65,55 +173,86 @@ class MCPServer:
         return result
     
     def handle_request(self, request):
-        """handle mcp request."""
+        """handle mcp request, returning the encoded response as bytes."""
+        if not isinstance(request, dict):
+            # e.g. a bare number inside a batch
+            return encode_error(-32600, "invalid request", None)
+        
         method = request.get("method")
         params = request.get("params", {})
         req_id = request.get("id")
         
         try:
             if method == "tools/list":
-                response = handle_tools_list(self.tools)
+                # the largest response by far, encoded once and reused
+                return encode_tools_list(self._tools_list(), req_id)
             
-            elif method == "tools/call":
+            if method == "tools/call":
+                # the hot path, encoded straight into a frame template
                 tool_name = params.get("name")
                 arguments = params.get("arguments", {})
-                result = self.execute_tool(tool_name, arguments)
-                
-                response = {
-                    "jsonrpc": "2.0",
-                    "result": {
-                        "content": [{"type": "text", "text": str(result)}]
-                    }
-                }
+                return encode_tool_result(self.execute_tool(tool_name, arguments), req_id)
             
-            else:
-                response = {
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32601, "message": f"method not found: {method}"}
-                }
+            if method == "shutdown":
+                # acknowledged here; run() exits after sending the response
+                return encode_empty_result(req_id)
             
-            response["id"] = req_id
-            return response
+            return encode_error(-32601, f"method not found: {method}", req_id)
         
         except Exception as e:
-            return {
-                "jsonrpc": "2.0",
-                "id": req_id,
-                "error": {"code": -32603, "message": str(e)}
-            }
+            # the exception type lets clients tell e.g. a bad argument
+            # (TypeError) from a missing tool (ValueError) without parsing
+            return encode_error(-32603, str(e), req_id, {"type": type(e).__name__})
+    
+    def handle_message(self, message, pool=None):
+        """handle one stdin message: a request or a json-rpc batch."""
+        if not isinstance(message, list):
+            return self.handle_request(message)
+        
+        if not message:
+            return encode_error(-32600, "invalid request: empty batch", None)
+        # json-rpc batch: answer in one array, running calls concurrently
+        # when a pool is given
+        if pool is None:
+            return [self.handle_request(request) for request in message]
+        return list(pool.map(self.handle_request, message))
+    
+    def _send_in_order(self, futures):
+        """
+        send responses in request order as they finish.
+        
+        once the next response is ready, any later ones already finished
+        behind it go out in the same write, so a burst of fast requests
+        costs one write instead of one per response.
+        """
+        i = 0
+        while i < len(futures):
+            ready = [futures[i].result()]
+            i += 1
+            while i < len(futures) and futures[i].done():
+                ready.append(futures[i].result())
+                i += 1
+            send_responses(ready)
     
     def run(self):
         """run server on stdio."""
         print(f"[OK] server started: {len(self.tools)} tools from {len(self.config.sdks)} sdks", file=sys.stderr)
         
-        while True:
-            request = read_request()
-            if not request:
-                break
-            
-            response = self.handle_request(request)
-            send_response(response)
-
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+            for messages in read_requests():
+                if len(messages) == 1:
+                    send_response(self.handle_message(messages[0], pool))
+                else:
+                    # pipelined requests: handle concurrently, reply in order.
+                    # batches among them run sequentially inside their worker
+                    # so workers never wait on the pool they occupy
+                    futures = [pool.submit(self.handle_message, message) for message in messages]
+                    self._send_in_order(futures)
+                
+                if any(map(_is_shutdown, messages)):
+                    break
+        
+        self.executor.close()
 
 if __name__ == "__main__":
     from config import load_config